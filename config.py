@@ -6,6 +6,8 @@ Configuration settings for the Excel Processing Application.
 Contains constants and settings used throughout the application.
 """
 
+import re
+
 # Sheet identification
 PR_SHEET_IDENTIFIER = "PR"
 
@@ -18,6 +20,15 @@ ADDABLE_COLUMNS = [
     'IGST'
 ]
 
+# Text columns with a lower ratio of unique values than this are stored as categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Number of rows processed at a time when populating LEDGER HEAD
+LEDGER_HEAD_CHUNK_ROWS = 50000
+
+# Number of rows streamed at a time when reading a sheet with openpyxl
+LOAD_CHUNK_ROWS = 50000
+
 # Footer detection keywords
 FOOTER_KEYWORDS = [
     'total',
@@ -30,6 +41,14 @@ FOOTER_KEYWORDS = [
     'net',
     'amount'
 ]
+# Keywords must start a word but may carry a suffix, e.g. 'Totals'
+FOOTER_KEYWORDS_RE = re.compile(r'\b(' + '|'.join(map(re.escape, FOOTER_KEYWORDS)) + r')', re.I)
+
+# Number of rows at the top of a sheet searched for the header row
+HEADER_SCAN_ROWS = 20
+
+# Number of rows at the bottom of a sheet materialized for footer detection
+FOOTER_SCAN_ROWS = 50
 
 # Common column header names for detecting the start of data
 COMMON_HEADER_NAMES = [
@@ -40,11 +59,21 @@ COMMON_HEADER_NAMES = [
     'invoice', 'inv', 'inv no', 'bill', 'bill no', 'receipt', 'receipt no',
     'payment', 'cheque', 'chq', 'chq no', 'bank', 'ledger'
 ]
+COMMON_HEADER_NAMES_SET = frozenset(COMMON_HEADER_NAMES)
+COMMON_HEADER_NAMES_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(COMMON_HEADER_NAMES, key=len, reverse=True))) + r')\b', re.I)
+
+# Column names grouped as text columns in the processing dialog
+TEXT_COLUMN_NAMES = ['date', 'particular', 'particulars', 'narration', 'description']
+
+# Number of leading rows sampled when classifying column types
+CLASSIFY_SAMPLE_ROWS = 1000
 
 # GUI settings
 WINDOW_TITLE = "Excel Processor"
 WINDOW_SIZE = "1000x600"
 PREVIEW_ROWS = 10
+TABLE_MAX_RENDER_ROWS = 200  # Larger tables show only their first and last rows
 
 # File types for file dialogs
 EXCEL_FILE_TYPES = [
@@ -6,9 +6,23 @@ Create a simple icon for the Tally_LH_Processor application.
 This script generates a basic icon file that can be used with PyInstaller.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+# Fonts to try, in order of preference
+FONT_CANDIDATES = ("arial.ttf", "DejaVuSans.ttf")
+
+@lru_cache(maxsize=None)
+def _load_font(size):
+    """Load the first available font at the given size, or the default font."""
+    for font_name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(font_name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
 def create_icon():
     """Create a simple icon for the application."""
     # Create a new image with a white background
@@ -20,25 +34,14 @@ def create_icon():
     draw.rectangle([(20, 20), (icon_size-20, icon_size-20)], 
                    fill=(46, 204, 113, 255), outline=(39, 174, 96, 255), width=4)
     
-    # Add text
-    try:
-        # Try to use a nice font if available
-        font = ImageFont.truetype("arial.ttf", 48)
-    except IOError:
-        # Fall back to default font
-        font = ImageFont.load_default()
-    
-    draw.text((icon_size//2, icon_size//2-10), "TLP", fill=(255, 255, 255, 255), 
-              font=font, anchor="mm")
-    
-    # Add a smaller text below
-    try:
-        small_font = ImageFont.truetype("arial.ttf", 20)
-    except IOError:
-        small_font = ImageFont.load_default()
-    
-    draw.text((icon_size//2, icon_size//2+40), "Tally Ledger Processor", 
-              fill=(255, 255, 255, 255), font=small_font, anchor="mm")
+    # Add the title text and a smaller text below it
+    text_items = [
+        ((icon_size//2, icon_size//2-10), "TLP", 48),
+        ((icon_size//2, icon_size//2+40), "Tally Ledger Processor", 20),
+    ]
+    for position, text, font_size in text_items:
+        draw.text(position, text, fill=(255, 255, 255, 255), 
+                  font=_load_font(font_size), anchor="mm")
     
     # Save as .ico file
     img.save("tally_lh_processor.ico", format="ICO")
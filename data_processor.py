@@ -6,9 +6,17 @@ Data processing module for the Excel Processing Application.
 Handles Excel file operations, data manipulation, and analysis.
 """
 
+import os
+from itertools import islice
 import pandas as pd
 import numpy as np
-from config import PR_SHEET_IDENTIFIER, FOOTER_KEYWORDS, COMMON_HEADER_NAMES
+from config import (PR_SHEET_IDENTIFIER, ADDABLE_COLUMNS, FOOTER_KEYWORDS_RE, COMMON_HEADER_NAMES_SET,
+                    COMMON_HEADER_NAMES_RE, HEADER_SCAN_ROWS, FOOTER_SCAN_ROWS,
+                    CATEGORY_MAX_UNIQUE_RATIO, LEDGER_HEAD_CHUNK_ROWS, TEXT_COLUMN_NAMES,
+                    CLASSIFY_SAMPLE_ROWS, LOAD_CHUNK_ROWS)
+
+# Key column names that mark a likely header row
+KEY_COLUMN_SET = frozenset(('date', 'particular', 'voucher'))
 
 class ExcelProcessor:
     """
@@ -29,21 +37,30 @@ class ExcelProcessor:
         self.footer_rows = []
         self.data_rows = []
         self._header_row_index = -1  # Index of the identified header row
+        self._clean_column_names = []  # Cleaned column names from the header row
+        self._column_kinds = {}  # Cached content type per (position, name), see classify_columns
+        self.data_version = 0  # Incremented whenever processed_data changes
     
-    def load_file(self, file_path):
+    def load_file(self, file_path, progress_callback=None):
         """
         Load an Excel file and identify the appropriate sheet.
         
         Args:
             file_path (str): Path to the Excel file
+            progress_callback (callable, optional): Called with a status message
+                as loading advances. It may be called from a worker thread.
             
         Returns:
             tuple: (success, message, sheet_names)
         """
         try:
             self.file_path = file_path
-            self.workbook = pd.ExcelFile(file_path)
-            sheet_names = self.workbook.sheet_names
+            self._column_kinds = {}
+            self.workbook = self._open_workbook(file_path)
+            if isinstance(self.workbook, pd.ExcelFile):
+                sheet_names = self.workbook.sheet_names
+            else:
+                sheet_names = self.workbook.sheetnames
             
             # Try to find a sheet with "PR" in its name
             pr_sheets = [sheet for sheet in sheet_names if PR_SHEET_IDENTIFIER.lower() in sheet.lower()]
@@ -55,10 +72,12 @@ class ExcelProcessor:
                 self.sheet_name = sheet_names[0]
                 message = f"No sheet with 'PR' in name found. Using first sheet: {self.sheet_name}"
             
-            # Load the raw data
-            self.raw_data = pd.read_excel(file_path, sheet_name=self.sheet_name)
+            # Load the raw data from the already opened workbook
+            self._report_progress(progress_callback, f"Reading sheet {self.sheet_name}...")
+            self.raw_data = self._read_sheet(self.sheet_name, progress_callback)
             
             # Process the data
+            self._report_progress(progress_callback, f"Detecting headers in {len(self.raw_data)} rows...")
             self._detect_structure()
             self._extract_data_rows()
             
@@ -67,6 +86,104 @@ class ExcelProcessor:
         except Exception as e:
             return False, f"Error loading file: {str(e)}", []
     
+    def _open_workbook(self, file_path):
+        """
+        Open an Excel file, preferring the compiled calamine reader.
+        
+        When python-calamine is not available (or pandas is older than 2.2),
+        .xlsx files are opened with openpyxl in read-only mode so only the
+        selected sheet is streamed. Other files use the default pandas engine.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            
+        Returns:
+            ExcelFile or openpyxl Workbook: Opened workbook
+        """
+        try:
+            return pd.ExcelFile(file_path, engine='calamine')
+        except (ImportError, ValueError):
+            pass
+        
+        if os.path.splitext(file_path)[1].lower() in ('.xlsx', '.xlsm'):
+            try:
+                import openpyxl
+            except ImportError:
+                pass
+            else:
+                # Cached values are enough and external workbook links are never followed
+                return openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+        
+        return pd.ExcelFile(file_path)
+    
+    def _report_progress(self, progress_callback, message):
+        """
+        Pass a loading status message to the progress callback, if any.
+        
+        Args:
+            progress_callback (callable): Callback given to load_file, or None
+            message (str): Status message
+        """
+        if progress_callback is not None:
+            progress_callback(message)
+    
+    def _read_sheet(self, sheet_name, progress_callback=None):
+        """
+        Read a sheet of the opened workbook as raw rows and close the workbook.
+        
+        The first row is not promoted to column names; header detection
+        works on the raw rows. Sheets opened with openpyxl are streamed in
+        chunks of LOAD_CHUNK_ROWS rows, reporting progress after each chunk.
+        
+        Args:
+            sheet_name (str): Name of the sheet to read
+            progress_callback (callable, optional): Called with a status message
+                after each chunk
+            
+        Returns:
+            DataFrame: Sheet contents with positional column labels
+        """
+        try:
+            if isinstance(self.workbook, pd.ExcelFile):
+                return self.workbook.parse(sheet_name, header=None)
+            
+            # Styled but empty cells widen the rows; pandas drops blank
+            # trailing columns, so track the widest filled row per chunk
+            rows = []
+            width = 0
+            row_iter = self.workbook[sheet_name].iter_rows(values_only=True)
+            while True:
+                chunk = list(islice(row_iter, LOAD_CHUNK_ROWS))
+                if not chunk:
+                    break
+                rows.extend(chunk)
+                width = max(width, max(self._filled_width(row) for row in chunk))
+                self._report_progress(progress_callback, f"Read {len(rows)} rows from {sheet_name}...")
+            
+            # Read-only worksheets may report trailing blank rows; pandas drops them
+            while rows and all(val is None for val in rows[-1]):
+                rows.pop()
+            
+            # Cut every row after the last filled column
+            return pd.DataFrame([row[:width] for row in rows])
+        finally:
+            self.workbook.close()
+    
+    def _filled_width(self, row):
+        """
+        Get the number of cells in a row up to and including its last filled cell.
+        
+        Args:
+            row (tuple): Cell values of a sheet row
+            
+        Returns:
+            int: Position of the last non-None value plus one, or 0 if the row is empty
+        """
+        for position in range(len(row) - 1, -1, -1):
+            if row[position] is not None:
+                return position + 1
+        return 0
+    
     def _detect_structure(self):
         """
         Detect header and footer rows in the Excel sheet.
@@ -82,32 +199,47 @@ class ExcelProcessor:
         max_header_matches = 0
         max_non_empty = 0
         
-        # Examine first 20 rows to find the best header row
-        for i, row in self.raw_data.iloc[:min(20, len(self.raw_data))].iterrows():
-            # Skip empty or nearly empty rows
-            non_empty_count = sum(1 for val in row if pd.notna(val))
-            if non_empty_count <= 2:
-                continue
-                
+        # Count non-empty cells per row once; the scans below only read the
+        # cell values of a small window at the top and bottom of the sheet
+        all_mask = self.raw_data.notna().to_numpy()
+        non_empty_per_row = all_mask.sum(axis=1)
+        
+        # Examine the first rows to find the best header row
+        top_values = self.raw_data.iloc[:HEADER_SCAN_ROWS].to_numpy(dtype=object)
+        top_mask = all_mask[:HEADER_SCAN_ROWS]
+        top_non_empty = non_empty_per_row[:HEADER_SCAN_ROWS]
+        
+        # Skip empty or nearly empty rows
+        for i in np.flatnonzero(top_non_empty > 2):
+            i = int(i)
+            non_empty_count = int(top_non_empty[i])
+            
             # Convert row values to lowercase strings for comparison
-            row_values = [str(val).lower().strip() for val in row if pd.notna(val)]
+            row_values = [str(val).lower().strip() for val in top_values[i][top_mask[i]]]
             
-            # Count how many common header names are in this row
-            header_name_matches = 0
-            for val in row_values:
-                for header_name in COMMON_HEADER_NAMES:
-                    if header_name in val or val in header_name:
-                        header_name_matches += 1
-                        break
+            # Count how many cells in this row name a common header, trying an
+            # exact lookup before searching for a header word inside the cell
+            header_name_matches = sum(
+                1 for val in row_values
+                if val in COMMON_HEADER_NAMES_SET or COMMON_HEADER_NAMES_RE.search(val)
+            )
             
             # Check for exact matches with key column names
-            key_columns = ['date', 'particular', 'voucher']
-            key_matches = sum(1 for val in row_values if val in key_columns)
+            key_matches = sum(1 for val in row_values if val in KEY_COLUMN_SET)
             
             # Prioritize rows with key column matches
             if key_matches > 0:
                 header_name_matches += key_matches * 2
             
+            # Take the first well-filled row naming every key column as the
+            # header and stop scanning. This is a heuristic: a later row with
+            # more header name matches is not considered.
+            if non_empty_count >= 4 and KEY_COLUMN_SET.issubset(row_values):
+                max_header_matches = header_name_matches
+                max_non_empty = non_empty_count
+                best_header_row = i
+                break
+            
             # If this row has more header matches than previous best, or same matches but more non-empty cells
             if (header_name_matches > max_header_matches) or \
                (header_name_matches == max_header_matches and non_empty_count > max_non_empty):
@@ -120,21 +252,30 @@ class ExcelProcessor:
             # All rows before the header row are also headers
             self.header_rows = list(range(best_header_row + 1))
             
-            # Use the header row to set column names
-            header_values = self.raw_data.iloc[best_header_row].tolist()
-            valid_headers = [str(h).strip() if pd.notna(h) else f"Column_{i+1}" for i, h in enumerate(header_values)]
+            # Use the header row to set column names, cleaning them once here
+            # for reuse when extracting and saving the data
+            header_values = top_values[best_header_row].tolist()
+            self._clean_column_names = [
+                str(h).strip() if pd.notna(h) and str(h).strip() and str(h).strip().lower() != 'nan'
+                else f"Column_{i+1}"
+                for i, h in enumerate(header_values)
+            ]
             
             # Store the identified header row index for later use
             self._header_row_index = best_header_row
         else:
-            # Fallback to heuristic approach if no clear header row found
-            for i, row in self.raw_data.iterrows():
-                # Count non-numeric values and non-empty cells
-                non_numeric_count = sum(1 for val in row if not self._is_numeric(val) and pd.notna(val))
-                non_empty_count = sum(1 for val in row if pd.notna(val))
+            # Fallback to heuristic approach if no clear header row found.
+            # Count non-numeric values and non-empty cells for all rows at once.
+            numeric_mask = self.raw_data.apply(self._to_numeric).notna().to_numpy()
+            non_numeric_per_row = (all_mask & ~numeric_mask).sum(axis=1)
+            row_length = len(self.raw_data.columns)
+            
+            for i in range(len(self.raw_data)):
+                non_numeric_count = non_numeric_per_row[i]
+                non_empty_count = non_empty_per_row[i]
                 
                 # Consider it a header if it has many non-numeric values or looks like column headers
-                if (non_numeric_count > len(row) / 3 and non_empty_count > len(row) / 4) or \
+                if (non_numeric_count > row_length / 3 and non_empty_count > row_length / 4) or \
                    (i < 5 and non_empty_count > 3 and non_numeric_count / max(non_empty_count, 1) > 0.7):
                     self.header_rows.append(i)
                 elif i > 0 and non_empty_count > 0:  # If we've found a data row after headers
@@ -142,18 +283,20 @@ class ExcelProcessor:
             
             # No specific header row identified
             self._header_row_index = -1
+            self._clean_column_names = []
         
         # Check for footer rows (summary rows or empty rows at the bottom)
         consecutive_empty_rows = 0
+        header_row_set = set(self.header_rows)
+        tail_start = max(0, len(self.raw_data) - FOOTER_SCAN_ROWS)
+        tail_values = self.raw_data.iloc[tail_start:].to_numpy(dtype=object)
         for i in range(len(self.raw_data) - 1, -1, -1):
-            row = self.raw_data.iloc[i]
-            
             # Skip if this row is already identified as a header
-            if i in self.header_rows:
+            if i in header_row_set:
                 break
                 
             # Check if row is empty or nearly empty
-            non_empty_count = sum(1 for val in row if pd.notna(val))
+            non_empty_count = non_empty_per_row[i]
             if non_empty_count <= 2:  # Row is empty or nearly empty
                 self.footer_rows.append(i)
                 consecutive_empty_rows += 1
@@ -163,14 +306,18 @@ class ExcelProcessor:
             else:
                 consecutive_empty_rows = 0  # Reset counter when we find a non-empty row
             
-            # Check if row contains summary keywords
-            row_values = [str(val).lower() for val in row if pd.notna(val)]
-            row_text = " ".join(row_values).lower()
-            if any(keyword in row_text for keyword in FOOTER_KEYWORDS):
+            # Check if row contains summary keywords, reading the values of
+            # the next block of rows up when the scan leaves the current one
+            if i < tail_start:
+                tail_start = max(0, i + 1 - FOOTER_SCAN_ROWS)
+                tail_values = self.raw_data.iloc[tail_start:i + 1].to_numpy(dtype=object)
+            row = tail_values[i - tail_start]
+            row_text = " ".join(str(val).lower() for val in row[all_mask[i]])
+            if FOOTER_KEYWORDS_RE.search(row_text):
                 self.footer_rows.append(i)
                 # Also include a few rows after a total/summary row as they're likely part of the footer
                 for j in range(i+1, min(i+3, len(self.raw_data))):
-                    if j not in self.footer_rows and j not in self.header_rows:
+                    if j not in self.footer_rows and j not in header_row_set:
                         self.footer_rows.append(j)
                 continue
             
@@ -183,32 +330,64 @@ class ExcelProcessor:
         Extract data rows excluding headers and footers.
         Use column names from identified header row if available.
         """
-        all_rows = set(range(len(self.raw_data)))
-        exclude_rows = set(self.header_rows + self.footer_rows)
-        self.data_rows = sorted(list(all_rows - exclude_rows))
+        row_count = len(self.raw_data)
+        header_set = set(self.header_rows)
+        footer_set = set(self.footer_rows)
+        data_start = len(header_set)
+        data_end = row_count - len(footer_set)
+        
+        if header_set == set(range(data_start)) and footer_set == set(range(data_end, row_count)):
+            # Headers are a prefix and footers a suffix (the usual layout),
+            # so the data rows are everything in between
+            self.data_rows = range(data_start, max(data_start, data_end))
+        else:
+            all_rows = set(range(row_count))
+            self.data_rows = sorted(all_rows - header_set - footer_set)
+        
+        # Select the data rows, using a plain slice when they are contiguous
+        rows = self.data_rows
+        if rows and rows[-1] - rows[0] + 1 == len(rows):
+            data = self.raw_data.iloc[rows[0]:rows[-1] + 1]
+        else:
+            data = self.raw_data.iloc[rows]
+        
+        # Create processed data with only data rows. The raw columns also hold
+        # header and footer text, so re-infer per-column dtypes for the data.
+        self.processed_data = data.infer_objects().reset_index(drop=True)
         
-        # Create processed data with only data rows
         if self._header_row_index >= 0:
-            # Get column names from the identified header row
-            header_values = self.raw_data.iloc[self._header_row_index].tolist()
-            column_names = []
-            
-            # Clean up column names
-            for i, h in enumerate(header_values):
-                if pd.isna(h):
-                    column_names.append(f"Column_{i+1}")
-                else:
-                    # Clean and normalize column name
-                    clean_name = str(h).strip()
-                    if not clean_name or clean_name.lower() == 'nan':
-                        clean_name = f"Column_{i+1}"
-                    column_names.append(clean_name)
-            
-            # Create DataFrame with proper column names
-            self.processed_data = pd.DataFrame(self.raw_data.iloc[self.data_rows].values, columns=column_names)
+            # Use column names from the identified header row
+            self.processed_data.columns = self._clean_column_names
         else:
-            # Fallback to original column names
-            self.processed_data = self.raw_data.iloc[self.data_rows].reset_index(drop=True)
+            # Fallback to positional column names
+            self.processed_data.columns = [f"Column_{i+1}" for i in range(len(self.processed_data.columns))]
+        
+        self._compact_text_columns()
+        self.data_version += 1
+    
+    def _compact_text_columns(self):
+        """
+        Store repetitive text columns as categoricals to reduce memory.
+        
+        Only columns holding nothing but strings are converted, so numeric and
+        date values are written back unchanged. Columns the application writes
+        to (see ADDABLE_COLUMNS) are left alone so new values can be assigned.
+        """
+        row_count = len(self.processed_data)
+        if row_count == 0:
+            return
+        
+        # Work by position since header rows may repeat a column name
+        for position, col in enumerate(self.processed_data.columns):
+            if col in ADDABLE_COLUMNS:
+                continue
+            
+            data = self.processed_data.iloc[:, position]
+            if pd.api.types.infer_dtype(data, skipna=True) != 'string':
+                continue
+            
+            if data.nunique() / row_count < CATEGORY_MAX_UNIQUE_RATIO:
+                self.processed_data.isetitem(position, data.astype('category'))
     
     def add_columns(self, columns_to_add):
         """
@@ -224,38 +403,134 @@ class ExcelProcessor:
             for column in columns_to_add:
                 if column not in self.processed_data.columns:
                     self.processed_data[column] = ""
+                    self.data_version += 1
             return True
         except Exception:
             return False
     
-    def process_ledger_head(self, selected_columns):
+    def process_ledger_head(self, selected_columns, progress_queue=None):
         """
         Process the LEDGER HEAD column based on numeric values in selected columns.
         
         Args:
             selected_columns (list): List of column names to analyze
+            progress_queue (Queue, optional): Receives the percentage of rows
+                processed after each chunk
             
         Returns:
             bool: Success status
         """
         try:
-            if 'LEDGER HEAD' not in self.processed_data.columns:
-                self.processed_data['LEDGER HEAD'] = ""
+            self.processed_data['LEDGER HEAD'] = self._build_ledger_head(selected_columns, progress_queue)
+            self.data_version += 1
             
-            for idx, row in self.processed_data.iterrows():
-                numeric_columns = []
-                
-                for col in selected_columns:
-                    if col in self.processed_data.columns and self._is_numeric(row[col]) and row[col] != 0:
-                        numeric_columns.append(col)
-                
-                if numeric_columns:
-                    self.processed_data.at[idx, 'LEDGER HEAD'] = " + ".join(numeric_columns)
+            return True
+        except Exception:
+            return False
+    
+    def add_and_process(self, columns_to_add, selected_columns, progress_queue=None):
+        """
+        Add new columns and populate LEDGER HEAD in a single pass.
+        
+        The LEDGER HEAD values are computed before any column is added, so
+        each new column (LEDGER HEAD included) is written once.
+        
+        Args:
+            columns_to_add (list): List of column names to add
+            selected_columns (list): List of column names to analyze
+            progress_queue (Queue, optional): Receives the percentage of rows
+                processed after each chunk
+            
+        Returns:
+            bool: Success status
+        """
+        try:
+            ledger_head = self._build_ledger_head(selected_columns, progress_queue)
+            
+            new_columns = {col: "" for col in columns_to_add if col not in self.processed_data.columns}
+            new_columns['LEDGER HEAD'] = ledger_head
+            for column, values in new_columns.items():
+                self.processed_data[column] = values
+            self.data_version += 1
             
             return True
         except Exception:
             return False
     
+    def _build_ledger_head(self, selected_columns, progress_queue=None):
+        """
+        Compute the LEDGER HEAD values from numeric values in selected columns.
+        
+        Rows without a non-zero numeric value keep their current LEDGER HEAD
+        value, or an empty string if the column does not exist yet.
+        
+        Args:
+            selected_columns (list): List of column names to analyze
+            progress_queue (Queue, optional): Receives the percentage of rows
+                processed after each chunk
+            
+        Returns:
+            ndarray: LEDGER HEAD value for every row
+        """
+        columns = [col for col in selected_columns if col in self.processed_data.columns]
+        selected_data = self.processed_data[columns]
+        # Take the names from the selection, which holds every column sharing a
+        # repeated name
+        column_names = np.array(selected_data.columns, dtype=object)
+        
+        # Build the whole LEDGER HEAD column so it can be assigned in one write
+        if 'LEDGER HEAD' in self.processed_data.columns:
+            ledger_head = self.processed_data['LEDGER HEAD'].to_numpy(dtype=object, copy=True)
+        else:
+            ledger_head = np.full(len(self.processed_data), "", dtype=object)
+        
+        # Work in row chunks so the intermediate numeric frame and mask stay
+        # bounded in size on very large sheets
+        for start in range(0, len(selected_data), LEDGER_HEAD_CHUNK_ROWS):
+            chunk = selected_data.iloc[start:start + LEDGER_HEAD_CHUNK_ROWS]
+            
+            # Coerce the columns in one pass and build a row x column mask
+            # of cells holding a non-zero numeric value
+            numeric = chunk.apply(self._to_numeric)
+            mask = (numeric.notna() & (numeric != 0)).to_numpy(dtype=bool, na_value=False)
+            has_numeric = mask.any(axis=1)
+            
+            if progress_queue is not None:
+                progress_queue.put(100 * (start + len(chunk)) / len(selected_data))
+            
+            if not has_numeric.any():
+                continue
+            
+            # Rows with the same set of numeric columns get the same label, so
+            # join the names once per distinct row pattern and gather the
+            # labels by pattern index
+            patterns, pattern_index = np.unique(np.packbits(mask[has_numeric], axis=1),
+                                                axis=0, return_inverse=True)
+            pattern_masks = np.unpackbits(patterns, axis=1, count=len(column_names)).astype(bool)
+            labels = np.array([" + ".join(column_names[row_mask]) for row_mask in pattern_masks],
+                              dtype=object)
+            
+            chunk_head = ledger_head[start:start + len(chunk)]
+            chunk_head[has_numeric] = labels[pattern_index.reshape(-1)]
+        
+        return ledger_head
+    
+    def _to_numeric(self, series):
+        """
+        Convert a column to numbers, marking non-numeric cells as NaN.
+        
+        Date columns are treated as non-numeric.
+        
+        Args:
+            series (Series): Column to convert
+            
+        Returns:
+            Series: Numeric values with NaN for non-numeric cells
+        """
+        if pd.api.types.is_datetime64_any_dtype(series) or pd.api.types.is_timedelta64_dtype(series):
+            return pd.Series(np.nan, index=series.index)
+        return pd.to_numeric(series, errors='coerce')
+    
     def _is_numeric(self, val):
         """
         Check if a value is numeric (int or float) and not NaN.
@@ -266,14 +541,52 @@ class ExcelProcessor:
         Returns:
             bool: True if numeric, False otherwise
         """
-        if pd.isna(val):
-            return False
+        return bool(self._to_numeric(pd.Series([val], dtype=object)).notna().iloc[0])
+    
+    def classify_columns(self):
+        """
+        Group the processed data columns by content type.
         
-        try:
-            float_val = float(val)
-            return not pd.isna(float_val)
-        except (ValueError, TypeError):
-            return False
+        Types are judged from the first CLASSIFY_SAMPLE_ROWS rows. Each
+        column's type is cached until another file is loaded, so only columns
+        added since the last call are examined. Added columns start empty and
+        only LEDGER HEAD, which is not classified, is written to afterwards.
+        
+        Returns:
+            tuple: (numeric_columns, text_columns, other_columns), excluding LEDGER HEAD
+        """
+        groups = {'numeric': [], 'text': [], 'other': []}
+        sample = None
+        listed = set()
+        
+        # Work by position since header rows may repeat a column name
+        for position, column in enumerate(self.processed_data.columns):
+            if column == 'LEDGER HEAD':
+                continue  # Skip LEDGER HEAD column
+            
+            kind = self._column_kinds.get((position, column))
+            if kind is None:
+                # The leading rows are enough to judge a column's type
+                if sample is None:
+                    sample = self.processed_data.head(CLASSIFY_SAMPLE_ROWS)
+                
+                # Check if column contains mostly numeric values
+                numeric_ratio = self._to_numeric(sample.iloc[:, position]).notna().mean()
+                
+                if numeric_ratio > 0.5:  # If more than 50% values are numeric
+                    kind = 'numeric'
+                elif column.lower() in TEXT_COLUMN_NAMES:
+                    kind = 'text'
+                else:
+                    kind = 'other'
+                self._column_kinds[(position, column)] = kind
+            
+            # A repeated name is listed once, under the type of its first column
+            if column not in listed:
+                listed.add(column)
+                groups[kind].append(column)
+        
+        return groups['numeric'], groups['text'], groups['other']
     
     def get_preview_data(self, rows=10):
         """
@@ -292,13 +605,8 @@ class ExcelProcessor:
         preview = self.processed_data.head(rows).copy()
         
         # Ensure all columns have proper names (no 'Unnamed: X' columns)
-        renamed_columns = {}
-        for col in preview.columns:
-            if 'Unnamed:' in str(col):
-                renamed_columns[col] = f"Column_{preview.columns.get_loc(col)+1}"
-        
-        if renamed_columns:
-            preview = preview.rename(columns=renamed_columns)
+        preview.columns = [f"Column_{i+1}" if 'Unnamed:' in str(col) else col
+                           for i, col in enumerate(preview.columns)]
             
         return preview
     
@@ -319,38 +627,79 @@ class ExcelProcessor:
             # Determine which data to save based on header detection
             if self._header_row_index >= 0:
                 # Create a new DataFrame with the header row and processed data
-                # First, get the header row values
-                header_values = self.raw_data.iloc[self._header_row_index].tolist()
-                column_names = []
-                
-                # Clean up column names
-                for i, h in enumerate(header_values):
-                    if pd.isna(h):
-                        column_names.append(f"Column_{i+1}")
-                    else:
-                        clean_name = str(h).strip()
-                        if not clean_name or clean_name.lower() == 'nan':
-                            clean_name = f"Column_{i+1}"
-                        column_names.append(clean_name)
+                column_names = self._clean_column_names
                 
                 # Create output DataFrame with the processed data
                 output_data = self.processed_data.copy()
                 
                 # Add any missing columns from original data
+                missing_columns = {}
                 for i, col_name in enumerate(column_names):
-                    if col_name not in output_data.columns and i < len(self.raw_data.columns):
-                        # Get the column data from raw_data for the data rows
-                        col_data = [self.raw_data.iloc[idx, i] if i < len(self.raw_data.columns) else "" 
-                                   for idx in self.data_rows]
-                        output_data[col_name] = col_data
+                    if col_name not in output_data.columns and col_name not in missing_columns \
+                       and i < len(self.raw_data.columns):
+                        missing_columns[col_name] = i
+                
+                if missing_columns:
+                    # Get the column data from raw_data for the data rows in one slice
+                    missing_data = self.raw_data.iloc[self.data_rows, list(missing_columns.values())]
+                    missing_data = missing_data.reset_index(drop=True)
+                    missing_data.columns = list(missing_columns.keys())
+                    output_data = pd.concat([output_data.reset_index(drop=True), missing_data], axis=1)
             else:
                 # If no specific header row was detected, use the processed data as is
                 output_data = self.processed_data.copy()
             
             # Save to Excel - only the processed data with proper column names
-            output_data.to_excel(output_path, sheet_name=self.sheet_name, index=False)
+            if not self._write_xlsx_streaming(output_data, output_path):
+                output_data.to_excel(output_path, sheet_name=self.sheet_name, index=False)
             
             return True, f"File saved successfully to {output_path}"
         
         except Exception as e:
-            return False, f"Error saving file: {str(e)}"
\ No newline at end of file
+            return False, f"Error saving file: {str(e)}"
+    
+    def _write_xlsx_streaming(self, output_data, output_path):
+        """
+        Write data to an .xlsx file with xlsxwriter in constant memory mode.
+        
+        Rows are written in order and flushed to disk as the next row starts,
+        so memory use does not grow with the row count. pandas' to_excel
+        writes column by column, which constant memory mode cannot handle,
+        so the rows are written here directly.
+        
+        Args:
+            output_data (DataFrame): Data to save
+            output_path (str): Path to save the Excel file
+            
+        Returns:
+            bool: True if the file was written, False if xlsxwriter is not
+            available or the path is not an .xlsx file
+        """
+        if os.path.splitext(output_path)[1].lower() != '.xlsx':
+            return False
+        try:
+            import xlsxwriter
+        except ImportError:
+            return False
+        
+        # Blank out missing values once for the whole frame and write
+        # infinities as text, as to_excel does, since xlsxwriter rejects them
+        values = output_data.to_numpy(dtype=object)
+        values = np.where(pd.isna(values), None, values)
+        values[values == np.inf] = 'inf'
+        values[values == -np.inf] = '-inf'
+        
+        workbook = xlsxwriter.Workbook(output_path, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        })
+        try:
+            worksheet = workbook.add_worksheet(self.sheet_name)
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+            worksheet.write_row(0, 0, [str(col) for col in output_data.columns], header_format)
+            for row_index, row in enumerate(values.tolist(), 1):
+                worksheet.write_row(row_index, 0, row)
+        finally:
+            workbook.close()
+        
+        return True
\ No newline at end of file
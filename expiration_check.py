@@ -7,17 +7,20 @@ Implements a simple 6-month expiration check based on current date.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 import sys
 
 # Set the start date (current date when implementing this feature)
 START_DATE = datetime(2025, 8, 8)  # August 8, 2025
 EXPIRATION_MONTHS = 6
 
+# The expiration date is fixed, so compute it and its display text once
+EXPIRATION_DATE = START_DATE + timedelta(days=EXPIRATION_MONTHS * 30)  # Approximately 6 months
+EXPIRATION_DATE_TEXT = EXPIRATION_DATE.strftime('%B %d, %Y')
+
 def calculate_expiration_date():
     """Calculate the expiration date (6 months from start date)."""
-    # Add 6 months to the start date
-    expiration_date = START_DATE + timedelta(days=180)  # Approximately 6 months
-    return expiration_date
+    return EXPIRATION_DATE
 
 def is_expired():
     """
@@ -26,10 +29,7 @@ def is_expired():
     Returns:
         bool: True if expired, False if still valid
     """
-    current_date = datetime.now()
-    expiration_date = calculate_expiration_date()
-    
-    return current_date > expiration_date
+    return datetime.now() > EXPIRATION_DATE
 
 def get_days_remaining():
     """
@@ -38,10 +38,7 @@ def get_days_remaining():
     Returns:
         int: Number of days remaining (negative if expired)
     """
-    current_date = datetime.now()
-    expiration_date = calculate_expiration_date()
-    
-    days_remaining = (expiration_date - current_date).days
+    days_remaining = (EXPIRATION_DATE - datetime.now()).days
     return days_remaining
 
 def get_expiration_message():
@@ -55,12 +52,11 @@ def get_expiration_message():
         return "This application has expired. Please contact the developer for an updated version."
     
     days_remaining = get_days_remaining()
-    expiration_date = calculate_expiration_date()
     
     if days_remaining <= 30:
-        return f"Warning: This application will expire in {days_remaining} days on {expiration_date.strftime('%B %d, %Y')}."
+        return f"Warning: This application will expire in {days_remaining} days on {EXPIRATION_DATE_TEXT}."
     
-    return f"Application expires on {expiration_date.strftime('%B %d, %Y')} ({days_remaining} days remaining)."
+    return f"Application expires on {EXPIRATION_DATE_TEXT} ({days_remaining} days remaining)."
 
 def should_disable_functionality():
     """
@@ -78,10 +74,16 @@ def get_expiration_status():
     Returns:
         dict: Dictionary containing expiration status details
     """
+    # The status only changes when the date does, so cache it per day
+    return dict(_get_expiration_status_for(datetime.now().date()))
+
+@lru_cache(maxsize=1)
+def _get_expiration_status_for(current_date):
+    """Build the expiration status for the given date."""
     return {
         'is_expired': is_expired(),
         'days_remaining': get_days_remaining(),
-        'expiration_date': calculate_expiration_date(),
+        'expiration_date': EXPIRATION_DATE,
         'start_date': START_DATE,
         'message': get_expiration_message()
     }
@@ -7,15 +7,111 @@ Implements the user interface using Tkinter.
 """
 
 import os
+import queue
+import concurrent.futures
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import pandas as pd
 
 from data_processor import ExcelProcessor
-from utils import create_scrollable_frame, create_data_table, create_search_bar
+from utils import create_text_pane, create_checklist, create_data_table, create_search_bar
 from config import ADDABLE_COLUMNS, EXCEL_FILE_TYPES, PREVIEW_ROWS
 from expiration_check import get_expiration_message, get_days_remaining, should_disable_functionality, get_expiration_status
 
+# Help dialog texts, built once at import
+_OVERVIEW_TEXT = (
+    "This application helps you process Excel files containing financial data. "
+    "It automatically detects header rows, allows you to add specific columns, "
+    "and can populate the LEDGER HEAD column based on numeric values in other columns.\n\n"
+    "Key Features:\n"
+    "• Automatic detection of PR sheets and header rows\n"
+    "• Adding custom columns (LEDGER HEAD, TAXABLE VALUE, etc.)\n"
+    "• Processing LEDGER HEAD based on numeric values\n"
+    "• Preview of data before saving\n"
+    "• Saving processed data to a new Excel file"
+)
+
+_WORKFLOW_TEXT = (
+    "1. Upload File\n"
+    "   • Click 'Upload File' and select an Excel file (.xlsx or .xls)\n"
+    "   • The application will automatically detect sheets with 'PR' in the name\n"
+    "   • Header and footer rows will be identified automatically\n\n"
+
+    "2. Add Columns\n"
+    "   • Click 'Add Columns' to open the column selection dialog\n"
+    "   • Select which columns to add (LEDGER HEAD, TAXABLE VALUE, etc.)\n"
+    "   • Click 'Add' to add the selected columns to your data\n\n"
+
+    "3. Process LEDGER HEAD\n"
+    "   • Click 'Process LEDGER HEAD' to open the processing dialog\n"
+    "   • Select which columns to analyze for numeric values\n"
+    "   • Use the search bar to filter columns if needed\n"
+    "   • Click 'Process' to populate the LEDGER HEAD column\n\n"
+
+    "4. Save Output\n"
+    "   • Click 'Save Output' to save the processed data\n"
+    "   • Choose a location and filename for the output file\n"
+    "   • The processed data will be saved with the proper column structure"
+)
+
+_COLUMNS_TEXT = (
+    "Required Columns:\n"
+    "The application works with any Excel sheet structure, but it's designed to work best "
+    "with financial data that includes these common columns:\n\n"
+
+    "• Date - Transaction dates\n"
+    "• Particular/Particulars - Transaction descriptions\n"
+    "• Voucher/Voucher No - Reference numbers\n"
+    "• Debit/Credit - Transaction amounts\n"
+    "• Amount - Transaction values\n\n"
+
+    "Added Columns:\n"
+    "The following columns can be added through the 'Add Columns' feature:\n\n"
+
+    "• LEDGER HEAD - Will be populated based on which columns contain numeric values\n"
+    "• TAXABLE VALUE - For tax-related calculations\n"
+    "• CGST - Central Goods and Services Tax\n"
+    "• SGST - State Goods and Services Tax\n"
+    "• IGST - Integrated Goods and Services Tax\n\n"
+
+    "LEDGER HEAD Processing:\n"
+    "When processing the LEDGER HEAD column, the application will:\n"
+    "1. Analyze each row in the selected columns\n"
+    "2. Identify cells with numeric values (excluding 0 and empty cells)\n"
+    "3. Populate the LEDGER HEAD column with the names of columns containing numeric values\n"
+    "4. If multiple columns have numeric values, they will be concatenated with '+'"
+)
+
+_ERRORS_TEXT = (
+    "Common Issues and Solutions:\n\n"
+
+    "1. File Loading Issues\n"
+    "   • Ensure the file is a valid Excel file (.xlsx or .xls)\n"
+    "   • Check if the file is open in another application\n"
+    "   • Verify the file is not corrupted\n\n"
+
+    "2. Header Detection Problems\n"
+    "   • If headers are not correctly detected, check if your Excel sheet has clear column headers\n"
+    "   • Headers are detected based on common column names like 'Date', 'Particular', 'Voucher'\n"
+    "   • The application looks for rows with multiple text cells that match common header patterns\n\n"
+
+    "3. LEDGER HEAD Processing Issues\n"
+    "   • Ensure the 'LEDGER HEAD' column has been added before processing\n"
+    "   • Verify that the columns you selected for processing contain numeric values\n"
+    "   • Check that the numeric values are properly formatted in Excel\n\n"
+
+    "4. Search Functionality\n"
+    "   • If search results don't appear, try scrolling up to see the results\n"
+    "   • Clear the search and try again with different terms\n"
+    "   • Make sure you're using simple search terms that match part of the column names\n\n"
+
+    "5. Saving Output\n"
+    "   • Ensure you have write permissions for the selected output location\n"
+    "   • If the file is in use by another application, close it before saving\n"
+    "   • Check that there's enough disk space available\n\n"
+
+    "If you encounter persistent issues, try restarting the application or checking your Excel file format."
+)
+
 class AppGUI:
     """
     Main application GUI class.
@@ -34,11 +130,24 @@ class AppGUI:
         self.root = root
         self.excel_processor = ExcelProcessor()
         self.is_expired = should_disable_functionality()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)  # Runs file I/O and processing off the GUI thread
+        self._add_columns_dialog = None  # Add columns dialog kept for reuse
+        self._process_dialog = None  # Process dialog kept for reuse
+        self._process_dialog_key = None  # Data and columns the process dialog was built for
+        self._preview_signature = None  # Data the preview table was last built from
+        self._data_buttons = []  # Buttons disabled while a file is loaded, processed or saved
+        
+        # Release the worker threads when the window is closed
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Create main frame
         self.main_frame = ttk.Frame(root, padding="10")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Create a style for the dialog checkbuttons
+        style = ttk.Style()
+        style.configure("Bold.TCheckbutton", font=("Arial", 10, "bold"))
+        
         # Create sections
         self._create_expiration_warning()
         self._create_file_section()
@@ -46,6 +155,13 @@ class AppGUI:
         self._create_preview_section()
         self._create_status_bar()
     
+    def _on_close(self):
+        """Stop the background workers and close the application window."""
+        # Queued tasks are dropped; a load or save already running is not
+        # waited for
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def _create_expiration_warning(self):
         """Create the expiration warning section."""
         days_remaining = get_days_remaining()
@@ -98,6 +214,7 @@ class AppGUI:
         # Upload button
         upload_btn = ttk.Button(file_frame, text="Upload File", command=self._upload_file)
         upload_btn.pack(side=tk.RIGHT, padx=5)
+        self._data_buttons.append(upload_btn)
         
         # Disable if expired
         if self.is_expired:
@@ -111,10 +228,12 @@ class AppGUI:
         # Add Columns button
         add_columns_btn = ttk.Button(action_frame, text="Add Columns", command=self._show_add_columns_dialog)
         add_columns_btn.pack(side=tk.LEFT, padx=5)
+        self._data_buttons.append(add_columns_btn)
         
         # Process LEDGER HEAD button
         process_btn = ttk.Button(action_frame, text="Process LEDGER HEAD", command=self._show_process_dialog)
         process_btn.pack(side=tk.LEFT, padx=5)
+        self._data_buttons.append(process_btn)
         
         # Help button
         help_btn = ttk.Button(action_frame, text="Help", command=self._show_help_dialog)
@@ -123,6 +242,7 @@ class AppGUI:
         # Save button
         save_btn = ttk.Button(action_frame, text="Save Output", command=self._save_output)
         save_btn.pack(side=tk.RIGHT, padx=5)
+        self._data_buttons.append(save_btn)
         
         # Disable all buttons if expired
         if self.is_expired:
@@ -170,9 +290,26 @@ class AppGUI:
         
         self.file_path_var.set(file_path)
         self.status_var.set("Loading file...")
-        self.root.update_idletasks()
+        self._set_data_buttons_enabled(False)
+        
+        # Load in the background so the window stays responsive. The worker
+        # only records the latest progress message; polling shows it.
+        progress = {'message': None}
+        future = self._executor.submit(self.excel_processor.load_file, file_path,
+                                       lambda message: progress.__setitem__('message', message))
+        self.root.after(50, self._check_load, future, progress)
+    
+    def _check_load(self, future, progress):
+        """Poll a background file load and show its result once finished."""
+        if not future.done():
+            if progress['message'] is not None:
+                self.status_var.set(progress['message'])
+                progress['message'] = None
+            self.root.after(50, self._check_load, future, progress)
+            return
         
-        success, message, sheet_names = self.excel_processor.load_file(file_path)
+        self._set_data_buttons_enabled(True)
+        success, message, sheet_names = future.result()
         
         if success:
             self.status_var.set(message)
@@ -181,24 +318,62 @@ class AppGUI:
             messagebox.showerror("Error", message)
             self.status_var.set("Error loading file")
     
+    def _set_data_buttons_enabled(self, enabled):
+        """
+        Enable or disable the buttons that read or change the loaded data.
+        
+        Background work replaces or writes to the data, so only one task may
+        run at a time.
+        
+        Args:
+            enabled (bool): Whether the buttons should be clickable; they stay
+                disabled once the application has expired
+        """
+        state = "normal" if enabled and not self.is_expired else "disabled"
+        for button in self._data_buttons:
+            button.configure(state=state)
+    
     def _show_add_columns_dialog(self):
         """Show dialog for adding columns."""
         if self.excel_processor.processed_data is None:
             messagebox.showinfo("Info", "Please upload a file first")
             return
         
+        # Reuse the dialog, starting again with no columns checked
+        if self._add_columns_dialog is not None and self._add_columns_dialog.winfo_exists():
+            self._add_columns_dialog.clear_selection()
+            self._add_columns_dialog.deiconify()
+            self._add_columns_dialog.lift()
+            self._add_columns_dialog.grab_set()
+            return
+        
         # Create dialog window
         dialog = tk.Toplevel(self.root)
         dialog.title("Add Columns")
         dialog.geometry("300x300")
         dialog.transient(self.root)
         dialog.grab_set()
+        self._add_columns_dialog = dialog
+        
+        def close_dialog():
+            """Hide the dialog so it can be shown again without rebuilding it."""
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
         
         # Create checkboxes for columns
         ttk.Label(dialog, text="Select columns to add:").pack(anchor=tk.W, padx=10, pady=5)
         
-        # Variables to track checkbox states
-        column_vars = {}
+        # Checked columns, kept in Python rather than one Tcl variable per checkbox
+        selected = set()
+        column_checkboxes = {}
+        
+        def toggle_column(column):
+            if column in selected:
+                selected.discard(column)
+            else:
+                selected.add(column)
         
         # Select All checkbox
         select_all_var = tk.BooleanVar()
@@ -206,23 +381,34 @@ class AppGUI:
         def toggle_all():
             """Toggle all checkboxes based on Select All state."""
             state = select_all_var.get()
-            for var in column_vars.values():
-                var.set(state)
+            if state:
+                selected.update(column_checkboxes)
+            else:
+                selected.clear()
+            for cb in column_checkboxes.values():
+                cb.state(['selected' if state else '!selected'])
+        
+        def clear_selection():
+            """Uncheck all checkboxes."""
+            select_all_var.set(False)
+            toggle_all()
+        
+        dialog.clear_selection = clear_selection
         
         select_all_cb = ttk.Checkbutton(dialog, text="Select All", variable=select_all_var, command=toggle_all)
         select_all_cb.pack(anchor=tk.W, padx=10, pady=5)
         
         # Individual column checkboxes
         for column in ADDABLE_COLUMNS:
-            var = tk.BooleanVar()
-            column_vars[column] = var
-            cb = ttk.Checkbutton(dialog, text=column, variable=var)
+            cb = ttk.Checkbutton(dialog, text=column, command=lambda c=column: toggle_column(c))
+            cb.state(['!alternate'])  # Show as unchecked rather than indeterminate
             cb.pack(anchor=tk.W, padx=20, pady=2)
+            column_checkboxes[column] = cb
         
         # Add button
         def add_selected_columns():
             """Add selected columns to the data."""
-            selected_columns = [col for col, var in column_vars.items() if var.get()]
+            selected_columns = [col for col in ADDABLE_COLUMNS if col in selected]
             
             if not selected_columns:
                 messagebox.showinfo("Info", "No columns selected")
@@ -233,7 +419,7 @@ class AppGUI:
             if success:
                 self._update_preview()
                 self.status_var.set(f"Added columns: {', '.join(selected_columns)}")
-                dialog.destroy()
+                close_dialog()
             else:
                 messagebox.showerror("Error", "Failed to add columns")
         
@@ -245,9 +431,24 @@ class AppGUI:
             messagebox.showinfo("Info", "Please upload a file first")
             return
         
+        # Offer to add LEDGER HEAD and process it in one step when it is missing
         if 'LEDGER HEAD' not in self.excel_processor.processed_data.columns:
-            messagebox.showinfo("Info", "Please add the 'LEDGER HEAD' column first")
-            return
+            if not messagebox.askyesno(
+                "Add LEDGER HEAD",
+                "The 'LEDGER HEAD' column has not been added yet.\n"
+                "Add it and populate it in one step?"
+            ):
+                return
+        
+        # Reuse the dialog and its checkboxes if it was built for the same data and columns
+        dialog_key = self._process_dialog_data_key()
+        if self._process_dialog is not None and self._process_dialog.winfo_exists():
+            if self._process_dialog_key == dialog_key:
+                self._process_dialog.deiconify()
+                self._process_dialog.lift()
+                self._process_dialog.grab_set()
+                return
+            self._process_dialog.destroy()
         
         # Create dialog window with better size
         dialog = tk.Toplevel(self.root)
@@ -257,6 +458,13 @@ class AppGUI:
         dialog.transient(self.root)
         dialog.grab_set()
         
+        def close_dialog():
+            """Hide the dialog so it can be shown again without rebuilding it."""
+            dialog.grab_release()
+            dialog.withdraw()
+        
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+        
         # Get all available columns
         available_columns = list(self.excel_processor.processed_data.columns)
         
@@ -284,28 +492,42 @@ class AppGUI:
         search_frame = ttk.Frame(content_frame)
         search_frame.pack(fill=tk.X, pady=10)
         
-        # Variables to track checkbox states
-        column_vars = {}
-        column_checkboxes = {}
-        visible_columns = set(available_columns)  # Track currently visible columns
+        # Group columns by type for better organization
+        numeric_columns, text_columns, other_columns = self.excel_processor.classify_columns()
+        ordered_columns = list(dict.fromkeys(numeric_columns + text_columns + other_columns))
+        
+        # Checked columns; text columns start unchecked, the rest checked
+        selected = set(numeric_columns) | set(other_columns)
+        visible_columns = set(ordered_columns)  # Track currently visible columns
+        
+        # Number of visible columns that are checked, kept up to date so the
+        # Select All state is known without scanning the columns
+        counts = {'selected_visible': len(selected & visible_columns)}
         
         # Function to update the Select All checkbox state
         def update_select_all_state():
             if visible_columns:
-                all_selected = all(column_vars[col].get() for col in visible_columns)
-                select_all_var.set(all_selected)
+                select_all_var.set(counts['selected_visible'] == len(visible_columns))
+        
+        def on_column_toggled(column):
+            counts['selected_visible'] += 1 if column in selected else -1
+            update_select_all_state()
         
         # Select All checkbox with better styling
         select_all_frame = ttk.Frame(content_frame)
         select_all_frame.pack(fill=tk.X, pady=5)
         
-        select_all_var = tk.BooleanVar(value=True)
+        select_all_var = tk.BooleanVar(value=counts['selected_visible'] == len(visible_columns))
         
         def toggle_all():
             """Toggle all visible checkboxes based on Select All state."""
-            state = select_all_var.get()
-            for col in visible_columns:
-                column_vars[col].set(state)
+            if select_all_var.get():
+                selected.update(visible_columns)
+                counts['selected_visible'] = len(visible_columns)
+            else:
+                selected.difference_update(visible_columns)
+                counts['selected_visible'] = 0
+            checklist.refresh(visible_columns)
         
         select_all_cb = ttk.Checkbutton(
             select_all_frame, 
@@ -324,107 +546,32 @@ class AppGUI:
         checkbox_frame = ttk.LabelFrame(content_frame, text="Available Columns")
         checkbox_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
-        checkbox_container, scrollable_frame = create_scrollable_frame(checkbox_frame)
-        checkbox_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Store reference to scrollable_frame for later use
-        self.column_scrollable_frame = scrollable_frame
-        
-        # Create a style for the checkbuttons
-        style = ttk.Style()
-        style.configure("Bold.TCheckbutton", font=("Arial", 10, "bold"))
-        
-        # Group columns by type for better organization
-        numeric_columns = []
-        text_columns = []
-        other_columns = []
-        
-        # Sort columns by type
-        for column in available_columns:
-            if column == 'LEDGER HEAD':
-                continue  # Skip LEDGER HEAD column
-                
-            # Check if column contains mostly numeric values
-            data = self.excel_processor.processed_data[column]
-            numeric_count = sum(1 for val in data if pd.notna(val) and isinstance(val, (int, float)))
-            
-            if numeric_count > len(data) * 0.5:  # If more than 50% values are numeric
-                numeric_columns.append(column)
-            elif column.lower() in ['date', 'particular', 'particulars', 'narration', 'description']:
-                text_columns.append(column)
-            else:
-                other_columns.append(column)
-        
-        # Add section headers and checkboxes
-        if numeric_columns:
-            ttk.Label(scrollable_frame, text="Numeric Columns", font=("Arial", 9, "bold")).pack(anchor=tk.W, pady=(5, 2))
-            for column in numeric_columns:
-                var = tk.BooleanVar(value=True)  # Default to selected
-                column_vars[column] = var
-                cb = ttk.Checkbutton(scrollable_frame, text=column, variable=var)
-                cb.pack(anchor=tk.W, padx=15, pady=2)
-                column_checkboxes[column] = cb
-        
-        if text_columns:
-            ttk.Label(scrollable_frame, text="Text Columns", font=("Arial", 9, "bold")).pack(anchor=tk.W, pady=(10, 2))
-            for column in text_columns:
-                var = tk.BooleanVar(value=False)  # Default to not selected for text columns
-                column_vars[column] = var
-                cb = ttk.Checkbutton(scrollable_frame, text=column, variable=var)
-                cb.pack(anchor=tk.W, padx=15, pady=2)
-                column_checkboxes[column] = cb
-        
-        if other_columns:
-            ttk.Label(scrollable_frame, text="Other Columns", font=("Arial", 9, "bold")).pack(anchor=tk.W, pady=(10, 2))
-            for column in other_columns:
-                var = tk.BooleanVar(value=True)  # Default to selected
-                column_vars[column] = var
-                cb = ttk.Checkbutton(scrollable_frame, text=column, variable=var)
-                cb.pack(anchor=tk.W, padx=15, pady=2)
-                column_checkboxes[column] = cb
+        # List the column checkboxes in one Treeview, grouped under section titles
+        checklist = create_checklist(
+            checkbox_frame,
+            [("Numeric Columns", numeric_columns),
+             ("Text Columns", text_columns),
+             ("Other Columns", other_columns)],
+            selected,
+            command=on_column_toggled
+        )
+        checklist.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Create enhanced search functionality
         def filter_columns(search_text):
             """Filter visible columns based on search text with improved matching."""
-            search_text = search_text.lower().strip()
-            visible_count = 0
             visible_columns.clear()
-            
-            # If search is empty, show all columns
-            if not search_text:
-                for column, cb in column_checkboxes.items():
-                    cb.pack(anchor=tk.W, padx=15, pady=2)
-                    visible_count += 1
-                    visible_columns.add(column)
-            else:
-                # First hide all section headers
-                for widget in scrollable_frame.winfo_children():
-                    if isinstance(widget, ttk.Label):
-                        widget.pack_forget()
-                
-                # Then show only matching columns
-                for column, cb in column_checkboxes.items():
-                    # More flexible matching - check if search text is contained in column name
-                    # or if column name starts with search text
-                    col_lower = column.lower()
-                    if search_text in col_lower or col_lower.startswith(search_text):
-                        cb.pack(anchor=tk.W, padx=15, pady=2)
-                        visible_count += 1
-                        visible_columns.add(column)
-                    else:
-                        cb.pack_forget()
+            visible_columns.update(checklist.filter(search_text))
+            counts['selected_visible'] = len(selected & visible_columns)
             
             # Update column count indicator
-            column_count_var.set(f"({visible_count} columns visible)")
+            column_count_var.set(f"({len(visible_columns)} columns visible)")
             
             # Update select all checkbox based on visible checkboxes
             update_select_all_state()
             
             # Reset scroll position to top to show the search results
-            self.root.after(50, lambda: scrollable_frame.reset_scroll())
-            
-            # Force update to ensure UI reflects changes immediately
-            scrollable_frame.update_idletasks()
+            checklist.reset_scroll()
         
         # Add enhanced search bar at the top
         create_search_bar(search_frame, filter_columns, "Search columns...")
@@ -437,13 +584,16 @@ class AppGUI:
         ttk.Button(
             button_frame, 
             text="Cancel", 
-            command=dialog.destroy
+            command=close_dialog
         ).pack(side=tk.RIGHT, padx=5)
         
+        # Progress bar, shown while processing runs
+        progress_bar = ttk.Progressbar(button_frame, mode="determinate", maximum=100)
+        
         # Process button
         def process_selected_columns():
             """Process LEDGER HEAD for selected columns with progress indication."""
-            selected_columns = [col for col, var in column_vars.items() if var.get()]
+            selected_columns = [col for col in ordered_columns if col in selected]
             
             if not selected_columns:
                 messagebox.showinfo("Info", "No columns selected")
@@ -451,41 +601,102 @@ class AppGUI:
             
             # Show processing indicator
             self.status_var.set("Processing LEDGER HEAD...")
-            self.root.update_idletasks()
+            process_btn.configure(state="disabled")
+            self._set_data_buttons_enabled(False)
+            progress_bar.configure(value=0)
+            progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
             
-            # Process the data
-            success = self.excel_processor.process_ledger_head(selected_columns)
+            # Process the data in the background, adding LEDGER HEAD in the
+            # same pass if needed; the worker reports progress through a queue
+            progress_queue = queue.Queue()
+            if 'LEDGER HEAD' in self.excel_processor.processed_data.columns:
+                future = self._executor.submit(
+                    self.excel_processor.process_ledger_head, selected_columns, progress_queue)
+            else:
+                future = self._executor.submit(
+                    self.excel_processor.add_and_process, ['LEDGER HEAD'], selected_columns, progress_queue)
+            self.root.after(100, check_process, future, progress_queue, len(selected_columns))
+        
+        def check_process(future, progress_queue, column_count):
+            """Poll background processing, updating the progress bar until it finishes."""
+            percent = None
+            while not progress_queue.empty():
+                percent = progress_queue.get_nowait()
+            if percent is not None and progress_bar.winfo_exists():
+                progress_bar.configure(value=percent)
             
-            if success:
+            if not future.done():
+                self.root.after(100, check_process, future, progress_queue, column_count)
+                return
+            
+            self._set_data_buttons_enabled(True)
+            if process_btn.winfo_exists():
+                process_btn.configure(state="normal")
+                progress_bar.pack_forget()
+            
+            if future.result():
+                # The dialog still matches the data it just processed
+                self._process_dialog_key = self._process_dialog_data_key()
                 self._update_preview()
-                self.status_var.set(f"Processed LEDGER HEAD based on {len(selected_columns)} columns")
-                dialog.destroy()
+                self.status_var.set(f"Processed LEDGER HEAD based on {column_count} columns")
+                close_dialog()
             else:
                 messagebox.showerror("Error", "Failed to process LEDGER HEAD")
                 self.status_var.set("Error processing LEDGER HEAD")
         
-        ttk.Button(
+        process_btn = ttk.Button(
             button_frame, 
             text="Process", 
             command=process_selected_columns
-        ).pack(side=tk.RIGHT, padx=5)
+        )
+        process_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Keep the dialog for reuse only once it is fully built
+        self._process_dialog = dialog
+        self._process_dialog_key = dialog_key
+    
+    def _process_dialog_data_key(self):
+        """Identify the data the process dialog was built for."""
+        data = self.excel_processor.processed_data
+        return (id(data), self.excel_processor.data_version, frozenset(data.columns))
     
     def _update_preview(self):
         """Update the data preview table with improved display."""
-        # Clear existing preview
-        for widget in self.preview_container.winfo_children():
-            widget.destroy()
+        # Keep the current table if the data has not changed since it was built
+        data = self.excel_processor.processed_data
+        total_rows = 0 if data is None else len(data)
+        signature = None
+        if data is not None:
+            signature = (id(data), self.excel_processor.data_version, tuple(data.columns), total_rows)
+            if signature == self._preview_signature:
+                return
+        self._preview_signature = signature
         
         # Get preview data
         preview_data = self.excel_processor.get_preview_data(rows=PREVIEW_ROWS)
         
+        # Keep the existing table when the columns are unchanged and only
+        # replace its rows; otherwise build a new table below
+        keep_table = (not preview_data.empty and self.preview_table is not None
+                      and self.preview_table.columns == list(preview_data.columns))
+        if keep_table:
+            self.preview_table.update_rows(preview_data)
+        else:
+            # Stop filling the old table before it is destroyed
+            if self.preview_table is not None:
+                self.preview_table.cancel_loading()
+                self.preview_table = None
+            
+            # Clear existing preview
+            for widget in self.preview_container.winfo_children():
+                widget.destroy()
+        
         if preview_data.empty:
             self.preview_info_var.set("No data to preview")
             self.status_var.set("No data to preview")
             return
         
         # Update preview info
-        total_rows = len(self.excel_processor.processed_data)
         header_count = len(self.excel_processor.header_rows)
         footer_count = len(self.excel_processor.footer_rows)
         
@@ -500,8 +711,9 @@ class AppGUI:
         )
         
         # Create new table with improved display
-        self.preview_table = create_data_table(self.preview_container, preview_data)
-        self.preview_table.pack(fill=tk.BOTH, expand=True)
+        if not keep_table:
+            self.preview_table = create_data_table(self.preview_container, preview_data)
+            self.preview_table.pack(fill=tk.BOTH, expand=True)
     
     def _show_help_dialog(self):
         """Show help dialog with user instructions and troubleshooting information."""
@@ -531,21 +743,9 @@ class AppGUI:
         # Overview Tab Content
         ttk.Label(overview_tab, text="Tally Data Processor", font=("Arial", 14, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
-        overview_text = (
-            "This application helps you process Excel files containing financial data. "
-            "It automatically detects header rows, allows you to add specific columns, "
-            "and can populate the LEDGER HEAD column based on numeric values in other columns.\n\n"
-            "Key Features:\n"
-            "• Automatic detection of PR sheets and header rows\n"
-            "• Adding custom columns (LEDGER HEAD, TAXABLE VALUE, etc.)\n"
-            "• Processing LEDGER HEAD based on numeric values\n"
-            "• Preview of data before saving\n"
-            "• Saving processed data to a new Excel file"
-        )
-        
         overview_label = ttk.Label(
             overview_tab, 
-            text=overview_text, 
+            text=_OVERVIEW_TEXT, 
             wraplength=650, 
             justify=tk.LEFT
         )
@@ -554,129 +754,20 @@ class AppGUI:
         # Workflow Tab Content
         ttk.Label(workflow_tab, text="Step-by-Step Workflow", font=("Arial", 14, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
-        workflow_text = (
-            "1. Upload File\n"
-            "   • Click 'Upload File' and select an Excel file (.xlsx or .xls)\n"
-            "   • The application will automatically detect sheets with 'PR' in the name\n"
-            "   • Header and footer rows will be identified automatically\n\n"
-            
-            "2. Add Columns\n"
-            "   • Click 'Add Columns' to open the column selection dialog\n"
-            "   • Select which columns to add (LEDGER HEAD, TAXABLE VALUE, etc.)\n"
-            "   • Click 'Add' to add the selected columns to your data\n\n"
-            
-            "3. Process LEDGER HEAD\n"
-            "   • Click 'Process LEDGER HEAD' to open the processing dialog\n"
-            "   • Select which columns to analyze for numeric values\n"
-            "   • Use the search bar to filter columns if needed\n"
-            "   • Click 'Process' to populate the LEDGER HEAD column\n\n"
-            
-            "4. Save Output\n"
-            "   • Click 'Save Output' to save the processed data\n"
-            "   • Choose a location and filename for the output file\n"
-            "   • The processed data will be saved with the proper column structure"
-        )
-        
-        # Create scrollable frame for workflow text
-        workflow_container, workflow_frame = create_scrollable_frame(workflow_tab)
-        workflow_container.pack(fill=tk.BOTH, expand=True)
-        
-        workflow_label = ttk.Label(
-            workflow_frame, 
-            text=workflow_text, 
-            wraplength=650, 
-            justify=tk.LEFT
-        )
-        workflow_label.pack(fill=tk.BOTH, expand=True, anchor=tk.W)
+        # Show the workflow text in a natively scrolling text area
+        create_text_pane(workflow_tab, _WORKFLOW_TEXT).pack(fill=tk.BOTH, expand=True)
         
         # Columns Tab Content
         ttk.Label(columns_tab, text="Column Information", font=("Arial", 14, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
-        columns_text = (
-            "Required Columns:\n"
-            "The application works with any Excel sheet structure, but it's designed to work best "
-            "with financial data that includes these common columns:\n\n"
-            
-            "• Date - Transaction dates\n"
-            "• Particular/Particulars - Transaction descriptions\n"
-            "• Voucher/Voucher No - Reference numbers\n"
-            "• Debit/Credit - Transaction amounts\n"
-            "• Amount - Transaction values\n\n"
-            
-            "Added Columns:\n"
-            "The following columns can be added through the 'Add Columns' feature:\n\n"
-            
-            "• LEDGER HEAD - Will be populated based on which columns contain numeric values\n"
-            "• TAXABLE VALUE - For tax-related calculations\n"
-            "• CGST - Central Goods and Services Tax\n"
-            "• SGST - State Goods and Services Tax\n"
-            "• IGST - Integrated Goods and Services Tax\n\n"
-            
-            "LEDGER HEAD Processing:\n"
-            "When processing the LEDGER HEAD column, the application will:\n"
-            "1. Analyze each row in the selected columns\n"
-            "2. Identify cells with numeric values (excluding 0 and empty cells)\n"
-            "3. Populate the LEDGER HEAD column with the names of columns containing numeric values\n"
-            "4. If multiple columns have numeric values, they will be concatenated with '+'"
-        )
-        
-        # Create scrollable frame for columns text
-        columns_container, columns_frame = create_scrollable_frame(columns_tab)
-        columns_container.pack(fill=tk.BOTH, expand=True)
-        
-        columns_label = ttk.Label(
-            columns_frame, 
-            text=columns_text, 
-            wraplength=650, 
-            justify=tk.LEFT
-        )
-        columns_label.pack(fill=tk.BOTH, expand=True, anchor=tk.W)
+        # Show the columns text in a natively scrolling text area
+        create_text_pane(columns_tab, _COLUMNS_TEXT).pack(fill=tk.BOTH, expand=True)
         
         # Errors Tab Content
         ttk.Label(errors_tab, text="Troubleshooting", font=("Arial", 14, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
-        errors_text = (
-            "Common Issues and Solutions:\n\n"
-            
-            "1. File Loading Issues\n"
-            "   • Ensure the file is a valid Excel file (.xlsx or .xls)\n"
-            "   • Check if the file is open in another application\n"
-            "   • Verify the file is not corrupted\n\n"
-            
-            "2. Header Detection Problems\n"
-            "   • If headers are not correctly detected, check if your Excel sheet has clear column headers\n"
-            "   • Headers are detected based on common column names like 'Date', 'Particular', 'Voucher'\n"
-            "   • The application looks for rows with multiple text cells that match common header patterns\n\n"
-            
-            "3. LEDGER HEAD Processing Issues\n"
-            "   • Ensure the 'LEDGER HEAD' column has been added before processing\n"
-            "   • Verify that the columns you selected for processing contain numeric values\n"
-            "   • Check that the numeric values are properly formatted in Excel\n\n"
-            
-            "4. Search Functionality\n"
-            "   • If search results don't appear, try scrolling up to see the results\n"
-            "   • Clear the search and try again with different terms\n"
-            "   • Make sure you're using simple search terms that match part of the column names\n\n"
-            
-            "5. Saving Output\n"
-            "   • Ensure you have write permissions for the selected output location\n"
-            "   • If the file is in use by another application, close it before saving\n"
-            "   • Check that there's enough disk space available\n\n"
-            
-            "If you encounter persistent issues, try restarting the application or checking your Excel file format."
-        )
-        
-        # Create scrollable frame for errors text
-        errors_container, errors_frame = create_scrollable_frame(errors_tab)
-        errors_container.pack(fill=tk.BOTH, expand=True)
-        
-        errors_label = ttk.Label(
-            errors_frame, 
-            text=errors_text, 
-            wraplength=650, 
-            justify=tk.LEFT
-        )
-        errors_label.pack(fill=tk.BOTH, expand=True, anchor=tk.W)
+        # Show the errors text in a natively scrolling text area
+        create_text_pane(errors_tab, _ERRORS_TEXT).pack(fill=tk.BOTH, expand=True)
         
         # Close button
         close_btn = ttk.Button(help_dialog, text="Close", command=help_dialog.destroy)
@@ -711,9 +802,20 @@ class AppGUI:
             return
         
         self.status_var.set("Saving file...")
-        self.root.update_idletasks()
+        self._set_data_buttons_enabled(False)
+        
+        # Save in the background so the window stays responsive
+        future = self._executor.submit(self.excel_processor.save_to_file, output_path)
+        self.root.after(50, self._check_save, future)
+    
+    def _check_save(self, future):
+        """Poll a background save and show its result once finished."""
+        if not future.done():
+            self.root.after(50, self._check_save, future)
+            return
         
-        success, message = self.excel_processor.save_to_file(output_path)
+        self._set_data_buttons_enabled(True)
+        success, message = future.result()
         
         if success:
             messagebox.showinfo("Success", message)
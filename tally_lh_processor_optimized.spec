@@ -17,7 +17,8 @@ hiddenimports = [
     'pandas._libs.tslibs.timedeltas',
     'pandas._libs.tslibs.nattype',
     'pandas._libs.tslibs.np_datetime',
-    'pandas._libs.skiplist'
+    'pandas._libs.skiplist',
+    'python_calamine'
 ]
 
 a = Analysis(
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the ExcelProcessor class.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import openpyxl
+import pandas as pd
+from openpyxl.styles import PatternFill
+
+from data_processor import ExcelProcessor
+
+
+def _save_workbook(rows, styled_blank_columns=0):
+    """
+    Write rows to a 'PR' sheet of a temporary .xlsx file.
+    
+    Args:
+        rows (list): Row values to write
+        styled_blank_columns (int): Number of empty but filled-in columns
+            added to the right of the data, as Tally exports often have
+        
+    Returns:
+        str: Path of the saved workbook
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "PR"
+    for row in rows:
+        sheet.append(row)
+    
+    fill = PatternFill(fill_type="solid", start_color="FFFF00")
+    width = max(len(row) for row in rows)
+    for row_number in range(1, len(rows) + 1):
+        for offset in range(styled_blank_columns):
+            sheet.cell(row=row_number, column=width + offset + 1).fill = fill
+    
+    handle, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(handle)
+    workbook.save(path)
+    return path
+
+
+class ReadSheetTest(unittest.TestCase):
+    """Reading sheets through the streamed openpyxl path."""
+    
+    def setUp(self):
+        rows = [["Date", "Particulars", "Voucher", "Debit", "Credit", "Narration"]]
+        rows += [["2024-04-01", f"Party {i}", f"V{i}", i * 10, None, "Note"] for i in range(1, 8)]
+        self.path = _save_workbook(rows, styled_blank_columns=5)
+        self.addCleanup(os.remove, self.path)
+    
+    def _read_with_openpyxl(self):
+        processor = ExcelProcessor()
+        processor.workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        return processor._read_sheet("PR")
+    
+    def test_styled_blank_columns_are_dropped(self):
+        data = self._read_with_openpyxl()
+        expected = pd.read_excel(self.path, header=None, engine="openpyxl")
+        
+        self.assertEqual(data.shape, (8, 6))
+        self.assertEqual(data.shape, expected.shape)
+    
+    def test_styled_blank_columns_are_dropped_across_chunks(self):
+        with mock.patch("data_processor.LOAD_CHUNK_ROWS", 3):
+            data = self._read_with_openpyxl()
+        expected = pd.read_excel(self.path, header=None, engine="openpyxl")
+        
+        self.assertEqual(data.shape, (8, 6))
+        pd.testing.assert_frame_equal(data, expected, check_dtype=False)
+
+
+class DetectStructureTest(unittest.TestCase):
+    """Header row detection."""
+    
+    def test_first_row_naming_every_key_column_is_the_header(self):
+        processor = ExcelProcessor()
+        processor.raw_data = pd.DataFrame([
+            ["Date", "Particular", "Voucher", "Remarks", None, None],
+            ["Date", "Particular", "Voucher", "Debit", "Credit", "Narration"],
+            ["2024-04-01", "Party", "V1", 100, None, "Note"],
+        ])
+        processor._detect_structure()
+        
+        # The second row scores higher, but scanning stops at the first row
+        # naming every key column
+        self.assertEqual(processor._header_row_index, 0)
+        self.assertEqual(processor.header_rows, [0])
+
+
+class LedgerHeadTest(unittest.TestCase):
+    """Populating the LEDGER HEAD column."""
+    
+    def test_nullable_integer_column(self):
+        processor = ExcelProcessor()
+        processor.processed_data = pd.DataFrame({
+            "Amount": pd.array([5, pd.NA, 0, 7], dtype="Int64"),
+            "Freight": [0.0, 2.5, None, 1.0],
+            "LEDGER HEAD": [""] * 4,
+        })
+        
+        self.assertTrue(processor.process_ledger_head(["Amount", "Freight"]))
+        self.assertEqual(processor.processed_data["LEDGER HEAD"].tolist(),
+                         ["Amount", "Freight", "", "Amount + Freight"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,80 +6,223 @@ Utility functions for the Excel Processing Application.
 Contains helper functions used across the application.
 """
 
+import numpy as np
 import pandas as pd
 import tkinter as tk
 from tkinter import ttk
+from config import TABLE_MAX_RENDER_ROWS
 
-def create_scrollable_frame(parent):
+# Tcl procedure inserting a list of (row number, tag, values) rows into a
+# Treeview, so a whole batch crosses from Python to Tcl in one call
+_INSERT_ROWS_PROC = """
+proc ::excel_processor_insert_rows {tree rows} {
+    foreach row $rows {
+        lassign $row number tag values
+        $tree insert {} end -text $number -values $values -tags [list $tag]
+    }
+}
+"""
+
+def create_text_pane(parent, text):
     """
-    Create a scrollable frame widget with both horizontal and vertical scrollbars.
+    Create a read-only, word-wrapped text area with a vertical scrollbar.
+    
+    The text is laid out and scrolled natively by the Text widget, which
+    also allows it to be selected and copied.
     
     Args:
         parent: Parent widget
+        text (str): Text to display
         
     Returns:
-        tuple: (container_frame, scrollable_frame, canvas)
+        ttk.Frame: Frame containing the text area and scrollbar
     """
-    # Create a container frame with scrollbars
-    container = ttk.Frame(parent)
-    
-    # Create canvas with scrollbars
-    canvas = tk.Canvas(container)
-    scrollbar_y = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
-    scrollbar_x = ttk.Scrollbar(container, orient="horizontal", command=canvas.xview)
+    frame = ttk.Frame(parent)
     
-    # Create a frame inside the canvas for content
-    scrollable_frame = ttk.Frame(canvas)
-    scrollable_frame.bind(
-        "<Configure>",
-        lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+    text_widget = tk.Text(
+        frame,
+        wrap="word",
+        font="TkDefaultFont",
+        relief=tk.FLAT,
+        borderwidth=0,
+        highlightthickness=0,
+        background=ttk.Style().lookup("TFrame", "background")
     )
+    scrollbar_y = ttk.Scrollbar(frame, orient="vertical", command=text_widget.yview)
+    text_widget.configure(yscrollcommand=scrollbar_y.set)
     
-    # Add mousewheel scrolling
-    def _on_mousewheel(event):
-        # Respond to Linux or Windows wheel event
-        if event.num == 4 or event.delta > 0:
-            canvas.yview_scroll(-1, "units")
-        elif event.num == 5 or event.delta < 0:
-            canvas.yview_scroll(1, "units")
-    
-    # Bind mousewheel events
-    canvas.bind_all("<MouseWheel>", _on_mousewheel)  # Windows
-    canvas.bind_all("<Button-4>", _on_mousewheel)    # Linux scroll up
-    canvas.bind_all("<Button-5>", _on_mousewheel)    # Linux scroll down
-    
-    # Place the frame in the canvas
-    canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-    canvas.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-    
-    # Grid layout for proper scrollbar placement
-    canvas.grid(row=0, column=0, sticky="nsew")
-    scrollbar_y.grid(row=0, column=1, sticky="ns")
-    scrollbar_x.grid(row=1, column=0, sticky="ew")
+    text_widget.insert("1.0", text)
+    text_widget.configure(state="disabled")
     
-    # Configure grid weights
+    text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+    
+    return frame
+
+def create_checklist(parent, sections, selected, command=None):
+    """
+    Create a scrollable checklist backed by a single Treeview.
+    
+    Each entry is a Treeview row whose text shows a check mark, so long
+    lists need no widget per entry and Tk only draws the visible rows.
+    Clicking a row toggles its entry in the selected set.
+    
+    Args:
+        parent: Parent widget
+        sections (list): (title, entries) pairs; entries are listed under their title
+        selected (set): Checked entries, updated in place when a row is clicked
+        command (callable, optional): Called with the entry after a click toggles it
+        
+    Returns:
+        Frame: Container frame with filter(), refresh() and reset_scroll() methods
+    """
+    container = ttk.Frame(parent)
+    tree = ttk.Treeview(container, show="tree", selectmode="none")
+    scrollbar_y = ttk.Scrollbar(container, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=scrollbar_y.set)
+    tree.tag_configure("section", font=("Arial", 9, "bold"))
+    
+    tree.grid(row=0, column=0, sticky="nsew")
+    scrollbar_y.grid(row=0, column=1, sticky="ns")
     container.grid_rowconfigure(0, weight=1)
     container.grid_columnconfigure(0, weight=1)
     
-    # Method to reset scroll position to top
-    def reset_scroll():
-        canvas.yview_moveto(0.0)
+    def label(entry):
+        return ("\u2611  " if entry in selected else "\u2610  ") + str(entry)
+    
+    # Insert every row once as a top-level item; filter() reorders and
+    # detaches them in a single call
+    headers = []  # (item id, search index) per section
+    entry_items = {}
+    item_entries = {}
+    for title, entries in sections:
+        if not entries:
+            continue
+        header_item = tree.insert("", "end", text=title, tags=("section",))
+        
+        # Search index of (lowercase text, entry, item id), built once so a
+        # search only compares strings
+        search_index = []
+        for entry in entries:
+            item = tree.insert("", "end", text=label(entry))
+            entry_items[entry] = item
+            item_entries[item] = entry
+            search_index.append((str(entry).lower(), entry, item))
+        headers.append((header_item, search_index))
+    
+    def filter_entries(search_text=""):
+        """Show the entries containing search_text, or all with section titles if empty."""
+        search_text = search_text.lower().strip()
+        rows = []
+        shown = []
+        
+        # Bind the list appends used per entry to locals for the loop below
+        add_row = rows.append
+        add_shown = shown.append
+        
+        for header_item, search_index in headers:
+            # Section titles are only shown for the full list
+            if not search_text:
+                add_row(header_item)
+            for lower, entry, item in search_index:
+                if not search_text or search_text in lower:
+                    add_row(item)
+                    add_shown(entry)
+        
+        tree.set_children("", *rows)
+        return shown
+    
+    def refresh(entries=None):
+        """Redraw the check marks of the given entries (all by default) from the selected set."""
+        for entry in entry_items if entries is None else entries:
+            tree.item(entry_items[entry], text=label(entry))
+    
+    def on_click(event):
+        entry = item_entries.get(tree.identify_row(event.y))
+        if entry is None:
+            return
+        if entry in selected:
+            selected.discard(entry)
+        else:
+            selected.add(entry)
+        tree.item(entry_items[entry], text=label(entry))
+        if command is not None:
+            command(entry)
+    
+    tree.bind("<Button-1>", on_click)
+    
+    # Attach the methods to the container
+    container.filter = filter_entries
+    container.refresh = refresh
+    container.reset_scroll = lambda: tree.yview_moveto(0.0)
     
-    # Attach the method to the scrollable_frame
-    scrollable_frame.reset_scroll = reset_scroll
+    return container
+
+def _table_rows(dataframe):
+    """
+    Prepare DataFrame rows for display in a table.
     
-    return container, scrollable_frame
+    Frames longer than TABLE_MAX_RENDER_ROWS are cut down to their first and
+    last rows before any per-cell work, and missing values are blanked for
+    the whole array in one pass.
+    
+    Args:
+        dataframe: Pandas DataFrame to display
+        
+    Returns:
+        tuple: (values, row_numbers) - object array of cell values and the
+        1-based position of each row in the full frame
+    """
+    # Keep only the head and tail of long frames, numbering rows by their
+    # position in the full frame
+    row_count = len(dataframe)
+    if row_count > TABLE_MAX_RENDER_ROWS:
+        half = TABLE_MAX_RENDER_ROWS // 2
+        row_numbers = np.r_[0:half, row_count - half:row_count] + 1
+        dataframe = pd.concat([dataframe.head(half), dataframe.tail(half)])
+    else:
+        row_numbers = np.arange(1, row_count + 1)
+    
+    # Convert the data to a NumPy array once; rows are read from it in batches.
+    # Missing cells are found column by column on the typed frame, and
+    # blanking them builds a new array, so the frame's data is never modified.
+    values = dataframe.to_numpy(dtype=object)
+    
+    # Plain NumPy integer and boolean columns cannot hold missing values, so
+    # only the other columns are checked, and nothing is done without any
+    nullable = [position for position, dtype in enumerate(dataframe.dtypes)
+                if not (isinstance(dtype, np.dtype) and dtype.kind in 'iub')]
+    if nullable:
+        nullable_missing = dataframe.iloc[:, nullable].isna().to_numpy()
+        if nullable_missing.any():
+            missing = np.zeros(values.shape, dtype=bool)
+            missing[:, nullable] = nullable_missing
+            values = np.where(missing, "", values)
+    
+    return values, row_numbers
 
-def create_data_table(parent, dataframe):
+def create_data_table(parent, dataframe, batch_size=20):
     """
     Create a table widget to display DataFrame data with proper scrollbars.
     
+    Rows are inserted lazily in idle-time batches: batches keep being added
+    while the inserted rows do not fill the view or it is scrolled towards
+    the last inserted row, so the window stays responsive between batches.
+    Row values are read from a NumPy array rather than through pandas.
+    Frames longer than TABLE_MAX_RENDER_ROWS show only their first and last
+    rows, cut down before any per-cell work.
+    
     Args:
         parent: Parent widget
         dataframe: Pandas DataFrame to display
+        batch_size: Number of rows inserted at a time
         
     Returns:
-        ttk.Frame: Frame containing the table and scrollbars
+        ttk.Frame: Frame containing the table and scrollbars, with a
+        columns attribute, an update_rows(dataframe) method that replaces
+        the rows of a frame with the same columns while keeping the table and
+        its column setup, and a cancel_loading() method that stops pending
+        inserts
     """
     # Create a frame to hold the table and scrollbars
     frame = ttk.Frame(parent)
@@ -91,20 +234,28 @@ def create_data_table(parent, dataframe):
     # Add vertical and horizontal scrollbars
     vsb = ttk.Scrollbar(frame, orient="vertical", command=table.yview)
     hsb = ttk.Scrollbar(frame, orient="horizontal", command=table.xview)
-    table.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+    table.configure(xscrollcommand=hsb.set)
+    
+    values_array, row_numbers = _table_rows(dataframe)
+    row_tags = ('even', 'odd')
+    
+    # Measure the displayed text of every cell at once and note which
+    # columns hold numbers, for the width calculation below
+    if len(values_array) > 0:
+        max_lengths = np.char.str_len(values_array.astype(str)).max(axis=0)
+    numeric_columns = [dtype.kind in 'iufb' for dtype in dataframe.dtypes]
     
     # Configure columns and headings with better width calculation
-    for col in columns:
+    for position, col in enumerate(columns):
         table.heading(col, text=col)
         
         # Calculate width based on column name and data
-        if len(dataframe) > 0:
+        if len(values_array) > 0:
             # Get maximum string length in this column (including header)
-            col_values = dataframe[col].astype(str)
-            max_len = max(len(str(col)), col_values.str.len().max())
+            max_len = max(len(str(col)), int(max_lengths[position]))
             
             # Adjust width based on content type
-            if dataframe[col].dtype in [int, float, bool]:
+            if numeric_columns[position]:
                 char_width = 8  # Narrower for numeric columns
             else:
                 char_width = 10  # Wider for text columns
@@ -115,21 +266,71 @@ def create_data_table(parent, dataframe):
             
         table.column(col, width=width, minwidth=50)
     
-    # Insert data rows with row numbers
-    for i, row in dataframe.iterrows():
-        values = [row[col] if pd.notna(row[col]) else "" for col in columns]
-        table.insert('', 'end', text=str(i+1), values=values, tags=('row',))
-    
     # Add alternating row colors
-    table.tag_configure('row', background='#f0f0f0')
-    for i, item in enumerate(table.get_children()):
-        if i % 2 == 0:
-            table.item(item, tags=('even',))
-        else:
-            table.item(item, tags=('odd',))
     table.tag_configure('even', background='#f0f0f0')
     table.tag_configure('odd', background='#ffffff')
     
+    # Rows to show, the number inserted so far and the idle callback of the next batch
+    load_state = {'values': values_array, 'row_numbers': row_numbers, 'inserted': 0, 'after_id': None}
+    table.tk.eval(_INSERT_ROWS_PROC)
+    
+    def insert_next_batch():
+        """Insert the next batch of data rows with row numbers."""
+        load_state['after_id'] = None
+        if not table.winfo_exists():
+            return
+        
+        values_array = load_state['values']
+        row_numbers = load_state['row_numbers']
+        start = load_state['inserted']
+        stop = min(start + batch_size, len(values_array))
+        rows = tuple(
+            (str(row_numbers[position]), row_tags[position & 1], tuple(values))
+            for position, values in enumerate(values_array[start:stop].tolist(), start)
+        )
+        table.tk.call('::excel_processor_insert_rows', str(table), rows)
+        load_state['inserted'] = stop
+    
+    def on_yscroll(first, last):
+        """Update the scrollbar and load more rows when nearing the end."""
+        vsb.set(first, last)
+        if float(last) >= 0.9 and load_state['inserted'] < len(load_state['values']) \
+           and load_state['after_id'] is None:
+            load_state['after_id'] = table.after_idle(insert_next_batch)
+    
+    def cancel_loading():
+        """Cancel the pending batch, if any."""
+        if load_state['after_id'] is not None:
+            table.after_cancel(load_state['after_id'])
+            load_state['after_id'] = None
+    
+    def update_rows(new_dataframe):
+        """Replace the rows with those of a frame with the same columns."""
+        cancel_loading()
+        table.delete(*table.get_children())
+        load_state['values'], load_state['row_numbers'] = _table_rows(new_dataframe)
+        load_state['inserted'] = 0
+        if len(load_state['values']) == 0:
+            return
+        
+        # Widen only the columns whose new values no longer fit
+        new_lengths = np.char.str_len(load_state['values'].astype(str)).max(axis=0)
+        for position, col in enumerate(columns):
+            char_width = 8 if numeric_columns[position] else 10
+            width = min(int(new_lengths[position]) * char_width, 300)
+            if width > int(table.column(col, 'width')):
+                table.column(col, width=width)
+        
+        load_state['after_id'] = table.after_idle(insert_next_batch)
+    
+    # Start inserting once the window is idle rather than while it is built
+    table.configure(yscrollcommand=on_yscroll)
+    if len(values_array) > 0:
+        load_state['after_id'] = table.after_idle(insert_next_batch)
+    frame.columns = columns
+    frame.update_rows = update_rows
+    frame.cancel_loading = cancel_loading
+    
     # Grid layout
     table.grid(row=0, column=0, sticky='nsew')
     vsb.grid(row=0, column=1, sticky='ns')
@@ -141,14 +342,19 @@ def create_data_table(parent, dataframe):
     
     return frame
 
-def create_search_bar(parent, callback, placeholder="Search..."):
+def create_search_bar(parent, callback, placeholder="Search...", delay=120):
     """
     Create an enhanced search bar widget with live filtering and placeholder text.
     
+    Typing is debounced: the callback runs once the text has not changed for
+    delay milliseconds, so a burst of keystrokes triggers a single search.
+    Clearing the search runs the callback immediately.
+    
     Args:
         parent: Parent widget
         callback: Function to call when search text changes
         placeholder: Placeholder text to show when search bar is empty
+        delay: Milliseconds to wait after the last keystroke
         
     Returns:
         ttk.Entry: Search entry widget
@@ -168,6 +374,21 @@ def create_search_bar(parent, callback, placeholder="Search..."):
     search_entry.insert(0, placeholder)
     search_entry.config(foreground="gray")
     
+    # Pending debounced callback and the last text it was run for
+    after_id = [None]
+    last_text = [""]
+    
+    def cancel_pending():
+        if after_id[0] is not None:
+            search_entry.after_cancel(after_id[0])
+            after_id[0] = None
+    
+    def run_callback(text):
+        after_id[0] = None
+        last_text[0] = text
+        if search_entry.winfo_exists():
+            callback(text)
+    
     def on_focus_in(event):
         if search_entry.get() == placeholder:
             search_entry.delete(0, tk.END)
@@ -177,6 +398,8 @@ def create_search_bar(parent, callback, placeholder="Search..."):
         if not search_entry.get():
             search_entry.insert(0, placeholder)
             search_entry.config(foreground="gray")
+            cancel_pending()
+            last_text[0] = ""
             callback("")  # Clear search when returning to placeholder
     
     search_entry.bind("<FocusIn>", on_focus_in)
@@ -186,20 +409,25 @@ def create_search_bar(parent, callback, placeholder="Search..."):
     def clear_search():
         search_entry.delete(0, tk.END)
         search_entry.focus_set()  # Keep focus in the search box
+        cancel_pending()
+        last_text[0] = ""
         callback("")  # Trigger search update with empty string
     
     clear_btn = ttk.Button(frame, text="✕", width=3, command=clear_search)
     clear_btn.pack(side=tk.RIGHT, padx=5)
     
-    # Bind callback to search variable - with debounce effect
-    def on_search_change(*args):
+    # Run the callback for typed changes only - with debounce effect. Key
+    # releases that leave the text unchanged (arrows, modifiers) are ignored,
+    # as are the placeholder swaps made on focus changes.
+    def on_search_change(event):
         # Get the current text
         text = search_var.get()
-        # Only trigger callback if not showing placeholder
-        if text != placeholder:
-            callback(text)
+        cancel_pending()
+        # Only schedule the callback if the text changed and is not the placeholder
+        if text != placeholder and text != last_text[0]:
+            after_id[0] = search_entry.after(delay, run_callback, text)
     
-    search_var.trace_add("write", on_search_change)
+    search_entry.bind("<KeyRelease>", on_search_change)
     
     frame.pack(fill=tk.X, padx=10, pady=5)
     return search_entry
\ No newline at end of file